@@ -0,0 +1,34 @@
+import time
+# Small in-memory TTL cache used by BaseAPI to serve repeated reads of reference data
+# (customer profile, account lists) without another round-trip to Parabank.
+
+# Keys are (url, sorted params) tuples; entries expire ttl seconds after being stored and the
+# oldest entry is dropped once maxsize is reached.
+
+class TTLCache:
+    def __init__(self, maxsize=512, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        if key not in self._data and len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def evict_prefix(self, prefix):
+        for key in [k for k in self._data if k[0].startswith(prefix)]:
+            del self._data[key]
+
+    def clear(self):
+        self._data.clear()
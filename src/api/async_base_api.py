@@ -0,0 +1,73 @@
+import asyncio
+import weakref
+import aiohttp
+# The following code provides an asyncio counterpart to BaseAPI so tests that need several
+# independent Parabank calls can issue them concurrently instead of one round-trip at a time.
+
+# AsyncBaseAPI mirrors the BaseAPI surface but returns decoded JSON bodies.
+# aiohttp sessions are bound to the event loop that created them, so one shared session is
+# kept per running loop (e.g. per pytest-asyncio test loop or asyncio.run call) and created
+# lazily on first use. Sessions for loops that have been garbage collected are dropped.
+
+class AsyncBaseAPI:
+    _sessions = weakref.WeakKeyDictionary()
+
+    def __init__(self, base_url="http://localhost:8080/parabank/services/bank"):
+        self.base_url = base_url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @classmethod
+    def _get_session(cls):
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={"Accept": "application/json"},
+            )
+            cls._sessions[loop] = session
+        return session
+
+    # Closes the session belonging to the current event loop.
+    @classmethod
+    async def close(cls):
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _request(self, method, endpoint, **kwargs):
+        async with self._get_session().request(method, f"{self.base_url}/{endpoint}", **kwargs) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def get(self, endpoint, params=None, headers=None, **kwargs):
+        return await self._request("GET", endpoint, params=params, headers=headers, **kwargs)
+
+    async def post(self, endpoint, data=None, json=None, headers=None, **kwargs):
+        return await self._request("POST", endpoint, data=data, json=json, headers=headers, **kwargs)
+
+    async def put(self, endpoint, data=None, json=None, headers=None, **kwargs):
+        return await self._request("PUT", endpoint, data=data, json=json, headers=headers, **kwargs)
+
+    async def delete(self, endpoint, headers=None, **kwargs):
+        return await self._request("DELETE", endpoint, headers=headers, **kwargs)
+
+
+# Runs the given coroutines concurrently and returns their results in order, e.g.
+#   accounts, customer = await run_parallel(api.get("customers/12212/accounts"), api.get("customers/12212"))
+
+async def run_parallel(*coros):
+    return await asyncio.gather(*coros)
+
+
+# The following class will allow for async testing of the public API endpoints.
+
+class AsyncPublicAPI(AsyncBaseAPI):
+    def __init__(self, base_url="http://parabank.parasoft.com:8080/parabank/services/bank"):
+        super().__init__(base_url)
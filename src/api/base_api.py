@@ -1,44 +1,141 @@
-import requests
+from __future__ import annotations
+import atexit
+import contextlib
+import os
+from typing import TYPE_CHECKING
+from src.api._cache import TTLCache
 # The following code will allow for shared/generic API calls to the Parabank application.
 # This is useful for both local and public API testing.
 
+# requests (and urllib3/ssl behind it) is imported on first use to keep test collection fast.
+if TYPE_CHECKING:
+    import requests
+
+# Sessions are shared per base_url so every BaseAPI/PublicAPI instance against the same
+# host reuses one pool of keep-alive connections instead of re-handshaking per instance.
+# pool_maxsize is kept well above urllib3's default of 10 so parallel (xdist) runs don't
+# discard and re-open sockets.
+_SESSIONS: dict[str, requests.Session] = {}
+
+
+def _get_session(base_url):
+    session = _SESSIONS.get(base_url)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Per-request headers should be passed via the headers= kwarg, which requests merges
+        # over these defaults rather than replacing them.
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Accept": "application/json",
+            "User-Agent": "parabank-tests/1.0",
+        })
+        _SESSIONS[base_url] = session
+    return session
+
+
+def _close_sessions():
+    for session in _SESSIONS.values():
+        session.close()
+    _SESSIONS.clear()
+
+
+atexit.register(_close_sessions)
+
+# Opt-in cache for idempotent GETs, shared by all clients. Entries are keyed by full URL, so
+# clients against different hosts never collide.
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=30)
+
 # BaseAPI class for handling HTTP requests to the Parabank API in a local environment.
-# This class provides methods only for GET and POST requests which are supported by the Parabank application.
+# GET and POST are the verbs supported by the Parabank application; PUT and DELETE are thin
+# wrappers over the same dispatcher for endpoints that accept them.
 
 class BaseAPI:
+    # Endpoints whose GET responses are cached without passing cache=True, e.g. {"customers"}.
+    CACHEABLE_ENDPOINTS = set()
+
     def __init__(self, base_url="http://localhost:8080/parabank/services/bank"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = _get_session(base_url)
 
-    def get(self, endpoint, params=None, headers=None):
-        url = f"{self.base_url}/{endpoint}"
-        response = self.session.get(url, params=params, headers=headers)
-        response.raise_for_status()
+    # Single dispatcher so every verb shares URL building, timeout and status handling.
+    def _request(self, method, endpoint, **kwargs):
+        response = self.session.request(method, f"{self.base_url}/{endpoint}", timeout=kwargs.pop("timeout", 10), **kwargs)
+        # Inline status check: the error message is only built when the call actually failed.
+        status_code = response.status_code
+        if status_code >= 400:
+            from requests import HTTPError
+            raise HTTPError(f"{status_code} Error: {response.reason} for url: {response.url}", response=response)
         return response
 
-    def post(self, endpoint, data=None, json=None, headers=None):
-        url = f"{self.base_url}/{endpoint}"
-        response = self.session.post(url, data=data, json=json, headers=headers)
-        response.raise_for_status()
+    # Writes drop any cached reads under the same top-level resource, e.g. a POST to
+    # "customers/12212/accounts" evicts every cached "customers/..." GET.
+    def _invalidate(self, endpoint):
+        _RESPONSE_CACHE.evict_prefix(f"{self.base_url}/{endpoint.split('/', 1)[0]}")
+
+    # Cache key: the URL with params encoded the way requests sends them, plus any per-request
+    # headers so reads made with different credentials never share an entry.
+    def _cache_key(self, endpoint, params, headers):
+        from requests.models import PreparedRequest
+
+        prepared = PreparedRequest()
+        prepared.prepare_url(f"{self.base_url}/{endpoint}", params)
+        return (prepared.url, tuple(sorted((headers or {}).items())))
+
+    # Cached responses are returned as the original Response object, so callers can keep
+    # using status_code/json()/text whether or not the cache was hit. Requests carrying other
+    # options (auth, cookies, ...) are never cached.
+    def get(self, endpoint, params=None, headers=None, cache=False, **kwargs):
+        cacheable = cache or endpoint.split("/", 1)[0] in self.CACHEABLE_ENDPOINTS
+        if not cacheable or set(kwargs) - {"timeout"}:
+            return self._request("GET", endpoint, params=params, headers=headers, **kwargs)
+        key = self._cache_key(endpoint, params, headers)
+        response = _RESPONSE_CACHE.get(key)
+        if response is None:
+            response = self._request("GET", endpoint, params=params, headers=headers, **kwargs)
+            _RESPONSE_CACHE.set(key, response)
         return response
 
-       
+    def post(self, endpoint, data=None, json=None, headers=None, **kwargs):
+        self._invalidate(endpoint)
+        return self._request("POST", endpoint, data=data, json=json, headers=headers, **kwargs)
+
+    def put(self, endpoint, data=None, json=None, headers=None, **kwargs):
+        self._invalidate(endpoint)
+        return self._request("PUT", endpoint, data=data, json=json, headers=headers, **kwargs)
+
+    def delete(self, endpoint, headers=None, **kwargs):
+        self._invalidate(endpoint)
+        return self._request("DELETE", endpoint, headers=headers, **kwargs)
+
+    # Streams large bodies (statements, exports) straight to disk instead of buffering them.
+    # A download that fails part-way removes the partial file.
+    def download(self, endpoint, dest_path, chunk_size=64 * 1024, **kwargs):
+        with self._request("GET", endpoint, stream=True, **kwargs) as response:
+            try:
+                with open(dest_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(dest_path)
+                raise
+        return dest_path
+
 
 # The following class will allow for testing the public API endpoints of the Parabank application.
 
 class PublicAPI(BaseAPI):
     def __init__(self, base_url="http://parabank.parasoft.com:8080/parabank/services/bank"):
         super().__init__(base_url)
-    
-    def get(self, endpoint, params=None, headers=None):
-        url = f"{self.base_url}/{endpoint}"
-        response = self.session.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response
 
-    def post(self, endpoint, data=None, json=None, headers=None):
-        url = f"{self.base_url}/{endpoint}"
-        response = self.session.post(url, data=data, json=json, headers=headers)
-        response.raise_for_status()
-        return response
-    
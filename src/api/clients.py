@@ -0,0 +1,18 @@
+import os
+from src.api.base_api import BaseAPI, PublicAPI
+# The following code picks the HTTP transport for API tests in one place so call sites
+# don't need to know which client implementation is in use.
+
+# USE_HTTPX=1 selects the httpx/HTTP2 clients from httpx_base_api; otherwise the
+# requests-based BaseAPI/PublicAPI are used. Code that constructs BaseAPI/PublicAPI
+# directly is not affected by USE_HTTPX.
+
+def api_class(public=False):
+    if os.getenv("USE_HTTPX") == "1":
+        from src.api.httpx_base_api import HttpxBaseAPI, HttpxPublicAPI
+        return HttpxPublicAPI if public else HttpxBaseAPI
+    return PublicAPI if public else BaseAPI
+
+
+def make_api(*args, public=False, **kwargs):
+    return api_class(public)(*args, **kwargs)
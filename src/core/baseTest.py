@@ -1,18 +1,44 @@
 # baseTest.py
+import re
 from playwright.sync_api import Page
 
+# Fills both credentials and submits the login form in a single browser round-trip.
+LOGIN_SCRIPT = """([username, password]) => {
+    const form = document.querySelector('input[name="username"]').form;
+    form.username.value = username;
+    form.password.value = password;
+    form.username.dispatchEvent(new Event('input', {bubbles: true}));
+    form.password.dispatchEvent(new Event('input', {bubbles: true}));
+    form.submit();
+}"""
+# Parabank lands on overview.htm after a successful login and login.htm after a rejected one.
+LOGIN_RESULT_URL = re.compile(r"(overview|login)\.htm")
+
 # BaseTest class for handling common test operations in Playwright 
 # This class provides methods for login and validation of login success.
 # It can be extended for other common test functionalities.
+# Pages created from a saved storage_state (see the authenticated_page fixture) are already
+# logged in; pass authenticated=True so login() only opens the overview instead of re-submitting.
 class BaseTest:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, authenticated: bool = False):
         self.page = page
+        self.authenticated = authenticated
 
-    def login(self, username, password):
+    # slow=True drives the form field by field, which is easier to follow when debugging.
+    def login(self, username, password, slow=False):
+        if self.authenticated:
+            self.page.goto("https://parabank.parasoft.com/parabank/overview.htm")
+            return
         self.page.goto("https://parabank.parasoft.com")
-        self.page.fill('input[name="username"]', username)
-        self.page.fill('input[name="password"]', password)
-        self.page.click('input[type="submit"]')
+        # Wait for the navigation triggered by the submit itself, not the current URL, which
+        # may already be login.htm after an earlier failed attempt.
+        with self.page.expect_navigation(url=LOGIN_RESULT_URL):
+            if slow:
+                self.page.fill('input[name="username"]', username)
+                self.page.fill('input[name="password"]', password)
+                self.page.click('input[type="submit"]')
+            else:
+                self.page.evaluate(LOGIN_SCRIPT, [username, password])
 
     def validate_login_success(self):
         assert self.page.inner_text("h2") == "Accounts Overview"
\ No newline at end of file
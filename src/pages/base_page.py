@@ -1,9 +1,15 @@
-from playwright.sync_api import Page, expect, Locator
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from src.config.settings import Settings
 from src.utils.logger import Logger
 import time
 
+# Playwright is only needed for type hints at import time; `expect` is imported inside the
+# assertion methods so importing page objects during test collection stays cheap.
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Locator
+
 # BasePage class that provides common functionality for all pages.
 # This class implements the foundation for the Page Object Model pattern.
 # It includes methods for navigation, element interaction, waiting, validation, and utility functions.
@@ -14,26 +20,56 @@ class BasePage:
     This class implements the foundation for the Page Object Model pattern.
     """
     
+    # Loggers are resolved once per page class rather than on every instantiation
+    _logger_cache: Dict[str, Any] = {}
+    # Environment config is loaded once and shared by every page object
+    _config: Optional[Dict[str, Any]] = None
+    # Child pages can set this to an element that marks the page as ready
+    page_ready_selector: Optional[str] = None
+    
     def __init__(self, page: Page):
         self.page = page
-        self.config = Settings.get_env_config()
+        if BasePage._config is None:
+            BasePage._config = Settings.get_env_config()
+        self.config = BasePage._config
         self.base_url = self.config['base_url']
-        self.logger = Logger.get_logger(self.__class__.__name__)
+        cls_name = self.__class__.__name__
+        if cls_name not in BasePage._logger_cache:
+            BasePage._logger_cache[cls_name] = Logger.get_logger(cls_name)
+        self.logger = BasePage._logger_cache[cls_name]
         self.timeout = self.config.get('timeouts', {}).get('element_wait', 10000)
-        
-        # Common selectors that appear across multiple pages
-        self.loading_spinner = ".loading, .spinner"
-        self.error_message = ".error, .alert-danger"
-        self.success_message = ".success, .alert-success"
-        self.modal_dialog = ".modal, .dialog"
-        self.modal_close_button = ".modal-close, .close"
+        self._locator_cache: Dict[str, Locator] = {}
+    
+    # ==================== COMMON LOCATORS ====================
+    # Locators for elements that appear across multiple pages, built once on first access.
+    # They resolve to the first match, like the non-strict selector lookups they replace.
+    
+    @cached_property
+    def loading_spinner(self) -> Locator:
+        return self.page.locator(".loading, .spinner").first
+    
+    @cached_property
+    def error_message(self) -> Locator:
+        return self.page.locator(".error, .alert-danger").first
+    
+    @cached_property
+    def success_message(self) -> Locator:
+        return self.page.locator(".success, .alert-success").first
+    
+    @cached_property
+    def modal_dialog(self) -> Locator:
+        return self.page.locator(".modal, .dialog").first
+    
+    @cached_property
+    def modal_close_button(self) -> Locator:
+        return self.page.locator(".modal-close, .close").first
     
     # ==================== NAVIGATION METHODS ====================
     
     def navigate_to(self, path: str = "") -> None:
         """Navigate to a specific path relative to base URL"""
         full_url = f"{self.base_url}{path}"
-        self.logger.info(f"Navigating to: {full_url}")
+        self.logger.info("Navigating to: %s", full_url)
         self.page.goto(full_url)
         self.wait_for_page_load()
     
@@ -58,9 +94,12 @@ class BasePage:
     # ==================== ELEMENT INTERACTION METHODS ====================
     
     def find_element(self, selector: str, timeout: Optional[int] = None) -> Locator:
-        """Find a single element with optional timeout"""
+        """Find a single element with optional timeout (locators are lazy, so they are cached per selector)"""
         timeout = timeout or self.timeout
-        return self.page.locator(selector)
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
     
     def find_elements(self, selector: str) -> List[Locator]:
         """Find multiple elements"""
@@ -71,90 +110,84 @@ class BasePage:
         timeout = timeout or self.timeout
         try:
             element = self.find_element(selector, timeout)
-            element.wait_for(state="visible", timeout=timeout)
-            element.click()
-            self.logger.info(f"Clicked element: {selector}")
+            element.click(timeout=timeout)
+            self.logger.info("Clicked element: %s", selector)
         except Exception as e:
-            self.logger.error(f"Failed to click element {selector}: {str(e)}")
+            self.logger.error("Failed to click element %s: %s", selector, e)
             raise
     
     def double_click(self, selector: str, timeout: Optional[int] = None) -> None:
         """Double click an element"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.dblclick()
-        self.logger.info(f"Double-clicked element: {selector}")
+        element.dblclick(timeout=timeout)
+        self.logger.info("Double-clicked element: %s", selector)
     
     def right_click(self, selector: str, timeout: Optional[int] = None) -> None:
         """Right click an element"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.click(button="right")
-        self.logger.info(f"Right-clicked element: {selector}")
+        element.click(button="right", timeout=timeout)
+        self.logger.info("Right-clicked element: %s", selector)
     
     def fill_text(self, selector: str, text: str, clear_first: bool = True, timeout: Optional[int] = None) -> None:
         """Fill text into an input field"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
         
         if clear_first:
-            element.clear()
+            element.clear(timeout=timeout)
         
-        element.fill(text)
-        self.logger.info(f"Filled text '{text}' into element: {selector}")
+        element.fill(text, timeout=timeout)
+        self.logger.info("Filled text '%s' into element: %s", text, selector)
     
-    def type_text(self, selector: str, text: str, delay: int = 100, timeout: Optional[int] = None) -> None:
-        """Type text with delay between characters (simulates human typing)"""
+    def type_text(self, selector: str, text: str, delay: int = 0, timeout: Optional[int] = None) -> None:
+        """Type text key by key (prefer fill_text unless key events are needed)"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.type(text, delay=delay)
-        self.logger.info(f"Typed text '{text}' into element: {selector}")
+        element.type(text, delay=delay, timeout=timeout)
+        self.logger.info("Typed text '%s' into element: %s", text, selector)
+    
+    def type_text_slow(self, selector: str, text: str, delay: int = 100, timeout: Optional[int] = None) -> None:
+        """Type text with delay between characters (simulates human typing)"""
+        self.type_text(selector, text, delay=delay, timeout=timeout)
     
     def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
         """Get text content of an element"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        text = element.inner_text()
-        self.logger.info(f"Retrieved text '{text}' from element: {selector}")
+        text = element.inner_text(timeout=timeout)
+        self.logger.info("Retrieved text '%s' from element: %s", text, selector)
         return text
     
     def get_attribute(self, selector: str, attribute: str, timeout: Optional[int] = None) -> Optional[str]:
         """Get attribute value of an element"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        value = element.get_attribute(attribute)
-        self.logger.info(f"Retrieved attribute '{attribute}' = '{value}' from element: {selector}")
+        value = element.get_attribute(attribute, timeout=timeout)
+        self.logger.info("Retrieved attribute '%s' = '%s' from element: %s", attribute, value, selector)
         return value
     
     def select_dropdown_option(self, selector: str, option_value: str, timeout: Optional[int] = None) -> None:
         """Select option from dropdown by value"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.select_option(value=option_value)
-        self.logger.info(f"Selected option '{option_value}' from dropdown: {selector}")
+        element.select_option(value=option_value, timeout=timeout)
+        self.logger.info("Selected option '%s' from dropdown: %s", option_value, selector)
     
     def select_dropdown_by_text(self, selector: str, option_text: str, timeout: Optional[int] = None) -> None:
         """Select option from dropdown by visible text"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.select_option(label=option_text)
-        self.logger.info(f"Selected option with text '{option_text}' from dropdown: {selector}")
+        element.select_option(label=option_text, timeout=timeout)
+        self.logger.info("Selected option with text '%s' from dropdown: %s", option_text, selector)
     
     def upload_file(self, selector: str, file_path: str, timeout: Optional[int] = None) -> None:
         """Upload file to file input"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.set_input_files(file_path)
-        self.logger.info(f"Uploaded file '{file_path}' to element: {selector}")
+        element.set_input_files(file_path, timeout=timeout)
+        self.logger.info("Uploaded file '%s' to element: %s", file_path, selector)
     
     # ==================== WAIT METHODS ====================
     
@@ -173,6 +206,7 @@ class BasePage:
     
     def wait_for_element_enabled(self, selector: str, timeout: Optional[int] = None) -> Locator:
         """Wait for element to be enabled"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         element.wait_for(state="visible", timeout=timeout)
@@ -181,103 +215,125 @@ class BasePage:
     
     def wait_for_text_present(self, selector: str, expected_text: str, timeout: Optional[int] = None) -> None:
         """Wait for specific text to appear in element"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_contain_text(expected_text, timeout=timeout)
     
     def wait_for_page_load(self, timeout: Optional[int] = None) -> None:
-        """Wait for page to fully load"""
+        """Wait for the DOM to load and, if set, for the page-ready element to be visible"""
         timeout = timeout or 30000
-        self.page.wait_for_load_state("networkidle", timeout=timeout)
+        self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        if self.page_ready_selector:
+            self.page.locator(self.page_ready_selector).wait_for(state="visible", timeout=timeout)
         self.wait_for_loading_to_complete()
     
     def wait_for_loading_to_complete(self, timeout: Optional[int] = None) -> None:
         """Wait for any loading spinners to disappear"""
-        timeout = timeout or self.timeout
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        timeout = timeout or 2000
         try:
-            self.page.wait_for_selector(self.loading_spinner, state="hidden", timeout=timeout)
-        except:
+            self.loading_spinner.wait_for(state="hidden", timeout=timeout)
+        except PlaywrightTimeoutError:
             # Loading spinner might not be present, which is fine
             pass
     
     # ==================== VALIDATION METHODS ====================
+    # Predicates return False immediately when nothing matches; use the wait_for_* methods
+    # to poll for an element that is expected to appear.
     
     def is_element_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
         """Check if element is visible"""
-        timeout = timeout or 5000
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        timeout = timeout or 500
         try:
             element = self.find_element(selector)
-            element.wait_for(state="visible", timeout=timeout)
+            if element.count() == 0:
+                return False
+            element.first.wait_for(state="visible", timeout=timeout)
             return True
-        except:
+        except PlaywrightTimeoutError:
             return False
     
     def is_element_enabled(self, selector: str, timeout: Optional[int] = None) -> bool:
         """Check if element is enabled"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         timeout = timeout or 5000
         try:
             element = self.find_element(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            return element.is_enabled()
-        except:
+            if element.count() == 0:
+                return False
+            element.first.wait_for(state="visible", timeout=timeout)
+            return element.first.is_enabled()
+        except PlaywrightTimeoutError:
             return False
     
     def is_text_present(self, selector: str, expected_text: str, timeout: Optional[int] = None) -> bool:
         """Check if text is present in element"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         timeout = timeout or 5000
         try:
             element = self.find_element(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            return expected_text in element.inner_text()
-        except:
+            if element.count() == 0:
+                return False
+            element.first.wait_for(state="visible", timeout=timeout)
+            return expected_text in element.first.inner_text()
+        except PlaywrightTimeoutError:
             return False
     
     # ==================== VERIFICATION METHODS ====================
     
     def verify_element_visible(self, selector: str, timeout: Optional[int] = None) -> None:
         """Verify element is visible (assertion)"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_be_visible(timeout=timeout)
-        self.logger.info(f"Verified element is visible: {selector}")
+        self.logger.info("Verified element is visible: %s", selector)
     
     def verify_element_hidden(self, selector: str, timeout: Optional[int] = None) -> None:
         """Verify element is hidden (assertion)"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_be_hidden(timeout=timeout)
-        self.logger.info(f"Verified element is hidden: {selector}")
+        self.logger.info("Verified element is hidden: %s", selector)
     
     def verify_text_equals(self, selector: str, expected_text: str, timeout: Optional[int] = None) -> None:
         """Verify element text equals expected value"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_have_text(expected_text, timeout=timeout)
-        self.logger.info(f"Verified text equals '{expected_text}' in element: {selector}")
+        self.logger.info("Verified text equals '%s' in element: %s", expected_text, selector)
     
     def verify_text_contains(self, selector: str, expected_text: str, timeout: Optional[int] = None) -> None:
         """Verify element text contains expected value"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_contain_text(expected_text, timeout=timeout)
-        self.logger.info(f"Verified text contains '{expected_text}' in element: {selector}")
+        self.logger.info("Verified text contains '%s' in element: %s", expected_text, selector)
     
     def verify_attribute_equals(self, selector: str, attribute: str, expected_value: str, timeout: Optional[int] = None) -> None:
         """Verify element attribute equals expected value"""
+        from playwright.sync_api import expect
         timeout = timeout or self.timeout
         element = self.find_element(selector)
         expect(element).to_have_attribute(attribute, expected_value, timeout=timeout)
-        self.logger.info(f"Verified attribute '{attribute}' equals '{expected_value}' in element: {selector}")
+        self.logger.info("Verified attribute '%s' equals '%s' in element: %s", attribute, expected_value, selector)
     
     def verify_url_contains(self, expected_url_part: str) -> None:
         """Verify current URL contains expected part"""
+        from playwright.sync_api import expect
         expect(self.page).to_have_url(f"*{expected_url_part}*")
-        self.logger.info(f"Verified URL contains: {expected_url_part}")
+        self.logger.info("Verified URL contains: %s", expected_url_part)
     
     def verify_page_title(self, expected_title: str) -> None:
         """Verify page title equals expected value"""
+        from playwright.sync_api import expect
         expect(self.page).to_have_title(expected_title)
-        self.logger.info(f"Verified page title: {expected_title}")
+        self.logger.info("Verified page title: %s", expected_title)
     
     # ==================== UTILITY METHODS ====================
     
@@ -289,7 +345,7 @@ class BasePage:
         
         screenshot_path = f"reports/screenshots/{filename}"
         self.page.screenshot(path=screenshot_path)
-        self.logger.info(f"Screenshot saved: {screenshot_path}")
+        self.logger.info("Screenshot saved: %s", screenshot_path)
         return screenshot_path
     
     def scroll_to_element(self, selector: str, timeout: Optional[int] = None) -> None:
@@ -297,7 +353,7 @@ class BasePage:
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
         element.scroll_into_view_if_needed()
-        self.logger.info(f"Scrolled to element: {selector}")
+        self.logger.info("Scrolled to element: %s", selector)
     
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page"""
@@ -317,19 +373,18 @@ class BasePage:
         """Hover over an element"""
         timeout = timeout or self.timeout
         element = self.find_element(selector, timeout)
-        element.wait_for(state="visible", timeout=timeout)
-        element.hover()
-        self.logger.info(f"Hovered over element: {selector}")
+        element.hover(timeout=timeout)
+        self.logger.info("Hovered over element: %s", selector)
     
     def press_key(self, key: str) -> None:
         """Press a keyboard key"""
         self.page.keyboard.press(key)
-        self.logger.info(f"Pressed key: {key}")
+        self.logger.info("Pressed key: %s", key)
     
     def press_key_combination(self, keys: str) -> None:
         """Press key combination (e.g., 'Control+C')"""
         self.page.keyboard.press(keys)
-        self.logger.info(f"Pressed key combination: {keys}")
+        self.logger.info("Pressed key combination: %s", keys)
     
     # ==================== COMMON UI PATTERNS ====================
     
@@ -348,28 +403,31 @@ class BasePage:
     
     def close_modal(self) -> None:
         """Close any open modal dialog"""
-        if self.is_element_visible(self.modal_dialog):
-            self.click(self.modal_close_button)
-            self.wait_for_element_hidden(self.modal_dialog)
+        if self.modal_dialog.is_visible():
+            self.modal_close_button.click(timeout=self.timeout)
+            self.modal_dialog.wait_for(state="hidden", timeout=self.timeout)
             self.logger.info("Closed modal dialog")
     
+    def _get_message_text(self, locator: Locator, timeout: int = 500) -> str:
+        """Return text of a message element, or "" if it does not appear within timeout"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        try:
+            return locator.inner_text(timeout=timeout)
+        except PlaywrightTimeoutError:
+            return ""
+    
     def get_error_message(self) -> str:
         """Get error message text if present"""
-        if self.is_element_visible(self.error_message):
-            return self.get_text(self.error_message)
-        return ""
+        return self._get_message_text(self.error_message)
     
     def get_success_message(self) -> str:
         """Get success message text if present"""
-        if self.is_element_visible(self.success_message):
-            return self.get_text(self.success_message)
-        return ""
+        return self._get_message_text(self.success_message)
     
     def verify_no_errors(self) -> None:
         """Verify no error messages are displayed"""
-        if self.is_element_visible(self.error_message):
-            error_text = self.get_text(self.error_message)
-            raise AssertionError(f"Unexpected error message displayed: {error_text}")
+        error_text = self.get_error_message()
+        assert not error_text, f"Unexpected error message displayed: {error_text}"
         self.logger.info("Verified no error messages are displayed")
     
     # ==================== EXTENSIBILITY HOOKS ====================
@@ -1,15 +1,27 @@
 from playwright.sync_api import Page, expect
-from src.core.baseTest import BaseTest
+from src.core.baseTest import BaseTest, LOGIN_SCRIPT, LOGIN_RESULT_URL
 from src.pages.base_page import BasePage
 
 # LoginPage class for handling login operations in the Parabank application.
 # This class extends BasePage to provide specific methods for login functionality.
 
-class LoginPage(BasePage):    
-    def login(self, username: str, password: str):
-        self.page.fill(self.username_field, username)
-        self.page.fill(self.password_field, password)
-        self.page.click(self.login_button)
+class LoginPage(BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        # Locators are lazy handles, so they are built once and reused across logins
+        self.username_locator = page.locator("input[name='username']")
+        self.password_locator = page.locator("input[name='password']")
+        self.login_button_locator = page.locator("input[type='submit']")
+
+    def login(self, username: str, password: str, slow: bool = False):
+        """Log in with a single scripted form submit (slow=True fills field by field)"""
+        with self.page.expect_navigation(url=LOGIN_RESULT_URL, timeout=self.timeout):
+            if slow:
+                self.username_locator.fill(username)
+                self.password_locator.fill(password)
+                self.login_button_locator.click()
+            else:
+                self.page.evaluate(LOGIN_SCRIPT, [username, password])
     
     def verify_login_error(self, expected_error: str):
-        expect(self.page.locator(self.error_message)).to_contain_text(expected_error)
\ No newline at end of file
+        expect(self.error_message).to_contain_text(expected_error)
\ No newline at end of file
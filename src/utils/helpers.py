@@ -5,26 +5,87 @@ Provides reusable functions for common automation tasks and patterns.
 
 import os
 import json
+import hashlib
+import itertools
 import time
 import random
 import string
+import tempfile
 import asyncio
-from datetime import datetime, timedelta
+import copy
+import functools
+from datetime import timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 import yaml
 
 from playwright.sync_api import Page, Locator, BrowserContext, expect
 from playwright.async_api import Page as AsyncPage
 
-from logger import get_logger
+from src.utils.logger import get_logger
 
 logger = get_logger("helpers")
 
+# Use orjson for the JSON caches when it is installed. Dates are passed through (and so rejected)
+# rather than converted to strings, matching the stdlib json behaviour.
+try:
+    import orjson
 
-@dataclass
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path via a temp file and rename so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Bump when create_test_users output changes so cached fixture files are regenerated
+_TEST_USERS_VERSION = 2
+
+# Use the libyaml C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _compute_env_overrides() -> Dict[str, Any]:
+    """Read configuration overrides from environment variables."""
+    return {
+        'base_url': os.getenv('BASE_URL'),
+        'browser': os.getenv('BROWSER', 'chromium'),
+        'headless': os.getenv('HEADLESS', 'true').lower() == 'true',
+        'timeout': int(os.getenv('TIMEOUT', '30000')),
+        'environment': os.getenv('TEST_ENV', 'dev'),
+        'parallel_workers': int(os.getenv('PARALLEL_WORKERS', '1')),
+        'video_recording': os.getenv('VIDEO_RECORDING', 'false').lower() == 'true',
+        'screenshot_on_failure': os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
+    }
+
+
+# Environment overrides are read once at import; call ConfigManager.refresh_env() after
+# changing the environment in-process so loaded configs pick up the new values
+_ENV_OVERRIDES = _compute_env_overrides()
+
+
+@dataclass(slots=True, frozen=True)
 class TestData:
     """Container for test data with validation."""
     username: str
@@ -44,44 +105,110 @@ class TestData:
             raise ValueError("Username and password are required")
 
 
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted config key once; repeated lookups reuse the parsed path."""
+    return tuple(key.split('.'))
+
+
 class ConfigManager:
     """
     Centralized configuration management for the automation framework.
     Supports multiple environments and configuration sources.
+    Configuration is loaded lazily on first access.
     """
     
+    # Parsed config files shared across instances: path -> (mtime, parsed dict)
+    _cache: Dict[Path, tuple] = {}
+    # Bumped by refresh_env so already-loaded instances rebuild with the new overrides
+    _env_generation = 0
+    
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = Path(config_file)
-        self.config = {}
-        self._load_config()
+        self._config = None
+        self._loaded_env_generation = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Merged file and environment configuration, loaded on first access."""
+        if self._config is None or self._loaded_env_generation != ConfigManager._env_generation:
+            self._load_config()
+        return self._config
+    
+    @classmethod
+    def refresh_env(cls):
+        """Re-read environment overrides and reload every instance on its next access."""
+        global _ENV_OVERRIDES
+        _ENV_OVERRIDES = _compute_env_overrides()
+        ConfigManager._env_generation += 1
+    
+    @classmethod
+    def _get_or_load(cls, path: Path) -> Dict[str, Any]:
+        """Parse a YAML config file, reusing cached results while its mtime is unchanged."""
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        
+        cached = cls._cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # A JSON sidecar written on the last parse is much cheaper to load than the YAML
+        sidecar = path.with_name(path.name + '.cache.json')
+        data = cls._read_sidecar(sidecar, mtime)
+        if data is None:
+            with open(path, 'r') as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+            cls._write_sidecar(sidecar, mtime, data)
+        
+        cls._cache[path] = (mtime, data)
+        return data
+    
+    @staticmethod
+    def _read_sidecar(sidecar: Path, mtime: float) -> Optional[Dict[str, Any]]:
+        """Return data from a JSON sidecar written for this YAML mtime, or None if unusable."""
+        try:
+            cached = _json_loads(sidecar.read_bytes())
+        except (OSError, ValueError):
+            # Missing, unreadable or partially written sidecar: fall back to the YAML
+            return None
+        if isinstance(cached, dict) and cached.get("mtime") == mtime:
+            return cached.get("data")
+        return None
+    
+    @staticmethod
+    def _write_sidecar(sidecar: Path, mtime: float, data: Dict[str, Any]) -> None:
+        """Atomically write a JSON sidecar, skipping data that doesn't survive a JSON round trip."""
+        try:
+            encoded = _json_dumps({"mtime": mtime, "data": data})
+        except TypeError as e:
+            logger.debug(f"Not caching {sidecar} as JSON: {str(e)}")
+            return
+        if _json_loads(encoded)["data"] != data:
+            # e.g. non-string keys, which stdlib json silently converts to strings
+            logger.debug(f"Not caching {sidecar} as JSON: data does not round-trip")
+            return
+        
+        try:
+            _atomic_write_bytes(sidecar, encoded)
+        except OSError as e:
+            logger.debug(f"Not caching {sidecar} as JSON: {str(e)}")
     
     def _load_config(self):
         """Load configuration from file and environment variables."""
-        # Load from YAML file if exists
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-        
-        # Override with environment variables
-        env_overrides = {
-            'base_url': os.getenv('BASE_URL'),
-            'browser': os.getenv('BROWSER', 'chromium'),
-            'headless': os.getenv('HEADLESS', 'true').lower() == 'true',
-            'timeout': int(os.getenv('TIMEOUT', '30000')),
-            'environment': os.getenv('TEST_ENV', 'dev'),
-            'parallel_workers': int(os.getenv('PARALLEL_WORKERS', '1')),
-            'video_recording': os.getenv('VIDEO_RECORDING', 'false').lower() == 'true',
-            'screenshot_on_failure': os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
-        }
+        # Deep copy so edits to one instance's config never leak into the shared cache
+        self._config = copy.deepcopy(self._get_or_load(self.config_file))
+        self._loaded_env_generation = ConfigManager._env_generation
         
         # Update config with non-None environment values
-        for key, value in env_overrides.items():
+        for key, value in _ENV_OVERRIDES.items():
             if value is not None:
-                self.config[key] = value
+                self._config[key] = value
     
     def get(self, key: str, default=None):
         """Get configuration value with dot notation support."""
-        keys = key.split('.')
+        keys = _split_key(key)
         value = self.config
         
         try:
@@ -109,7 +236,15 @@ class DataGenerator:
         chars = string.ascii_lowercase
         if include_numbers:
             chars += string.digits
-        return ''.join(random.choice(chars) for _ in range(length))
+        return ''.join(random.choices(chars, k=length))
+    
+    @staticmethod
+    def random_batch(n: int, length: int = 8, include_numbers: bool = True) -> List[str]:
+        """Generate n random strings in one pass."""
+        chars = string.ascii_lowercase
+        if include_numbers:
+            chars += string.digits
+        return [''.join(random.choices(chars, k=length)) for _ in range(n)]
     
     @staticmethod
     def random_email(domain: str = "testmail.com") -> str:
@@ -120,10 +255,7 @@ class DataGenerator:
     @staticmethod
     def random_phone() -> str:
         """Generate random US phone number."""
-        area_code = random.randint(200, 999)
-        exchange = random.randint(200, 999)
-        number = random.randint(1000, 9999)
-        return f"({area_code}) {exchange}-{number}"
+        return _random_phone(random)
     
     @staticmethod
     def random_amount(min_amount: float = 1.0, max_amount: float = 1000.0) -> float:
@@ -146,6 +278,109 @@ class DataGenerator:
             state="CA",
             zip_code="12345"
         )
+    
+    @staticmethod
+    def create_test_users(n: int, username_prefix: str = "testuser", seed: int = None,
+                          fixture_path: Union[str, Path] = None, workers: int = 1) -> List[TestData]:
+        """
+        Create n test users in one pass.
+        
+        Args:
+            n: Number of users to create
+            username_prefix: Prefix for generated usernames
+            seed: Seed for reproducible data
+            fixture_path: Optional JSON file used to cache the batch between runs;
+                it is regenerated when n, prefix, seed, workers or the generator version change
+            workers: Number of processes to shard generation across (worth it for
+                thousands of users; each shard is seeded separately from seed)
+            
+        Returns:
+            List of TestData instances
+        """
+        signature = hashlib.sha256(
+            repr((n, username_prefix, seed, workers, _TEST_USERS_VERSION)).encode()
+        ).hexdigest()
+        
+        if fixture_path:
+            fixture_path = Path(fixture_path)
+            cached = _read_test_users_fixture(fixture_path, signature)
+            if cached is not None:
+                return cached
+        
+        if workers > 1:
+            sizes = [n // workers + (1 if i < n % workers else 0) for i in range(workers)]
+            seeds = [None if seed is None else f"{seed}:{i}" for i in range(workers)]
+            with ProcessPoolExecutor(workers) as executor:
+                shards = executor.map(_generate_test_users, sizes, [username_prefix] * workers, seeds)
+                users = list(itertools.chain.from_iterable(shards))
+        else:
+            users = _generate_test_users(n, username_prefix, seed)
+        
+        if fixture_path:
+            _atomic_write_bytes(fixture_path, _json_dumps({"signature": signature, "users": [asdict(u) for u in users]}))
+            logger.info(f"Cached {n} test users to {fixture_path}")
+        
+        return users
+
+
+def _read_test_users_fixture(fixture_path: Path, signature: str) -> Optional[List[TestData]]:
+    """Return users cached in fixture_path for this signature, or None if unusable."""
+    try:
+        cached = _json_loads(fixture_path.read_bytes())
+    except (OSError, ValueError):
+        # Missing, unreadable or partially written fixture: regenerate
+        return None
+    if not isinstance(cached, dict) or cached.get("signature") != signature:
+        return None
+    try:
+        return [TestData(**user) for user in cached["users"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def _random_phone(rng: Any) -> str:
+    """Generate a US phone number from rng (the random module or a random.Random)."""
+    # One draw split into area code (200-999), exchange (200-999) and line number (1000-9999)
+    rest, number = divmod(rng.randrange(800 * 800 * 9000), 9000)
+    area_code, exchange = divmod(rest, 800)
+    return f"({area_code + 200}) {exchange + 200}-{number + 1000}"
+
+
+def _generate_test_users(n: int, username_prefix: str, seed: Any) -> List[TestData]:
+    """Generate n test users from one seeded RNG (module-level so worker processes can run it)."""
+    rng = random.Random(seed)
+    chars = string.ascii_lowercase + string.digits
+    return [
+        TestData(
+            username=f"{username_prefix}_{''.join(rng.choices(chars, k=6))}",
+            password="TestPass123!",
+            first_name="Test",
+            last_name="User",
+            email=f"{''.join(rng.choices(chars, k=8))}@testmail.com",
+            phone=_random_phone(rng),
+            address="123 Test Street",
+            city="Test City",
+            state="CA",
+            zip_code="12345"
+        )
+        for _ in range(n)
+    ]
+
+
+# Sets each field's value and fires input/change events; returns selectors that matched nothing
+# or that querySelector can't parse (Playwright-only syntax such as text=, >> or xpath=)
+_FILL_MANY_SCRIPT = """(fields) => {
+    const missing = [];
+    for (const [selector, value] of Object.entries(fields)) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) { el = null; }
+        if (!el) { missing.push(selector); continue; }
+        el.value = value;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+}"""
 
 
 class PageHelpers:
@@ -157,6 +392,15 @@ class PageHelpers:
     def __init__(self, page: Page):
         self.page = page
         self.default_timeout = 30000
+        # Locators are lazy handles that stay valid across navigations, so one per selector is enough
+        self._loc_cache: Dict[str, Locator] = {}
+    
+    def _loc(self, selector: str) -> Locator:
+        """Return the cached Locator for selector, creating it on first use."""
+        locator = self._loc_cache.get(selector)
+        if locator is None:
+            locator = self._loc_cache[selector] = self.page.locator(selector)
+        return locator
     
     def safe_click(self, selector: str, timeout: int = None) -> bool:
         """
@@ -172,9 +416,7 @@ class PageHelpers:
         timeout = timeout or self.default_timeout
         try:
             logger.info(f"Attempting to click element: {selector}")
-            element = self.page.locator(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            element.click(timeout=timeout)
+            self._loc(selector).click(timeout=timeout)
             logger.debug(f"Successfully clicked: {selector}")
             return True
         except Exception as e:
@@ -197,11 +439,10 @@ class PageHelpers:
         timeout = timeout or self.default_timeout
         try:
             logger.info(f"Attempting to fill element {selector} with value: {value}")
-            element = self.page.locator(selector)
-            element.wait_for(state="visible", timeout=timeout)
+            element = self._loc(selector)
             
             if clear_first:
-                element.clear()
+                element.clear(timeout=timeout)
             
             element.fill(value, timeout=timeout)
             logger.debug(f"Successfully filled {selector}")
@@ -210,6 +451,27 @@ class PageHelpers:
             logger.error(f"Failed to fill element {selector}: {str(e)}")
             return False
     
+    def fill_many(self, fields: Dict[str, str]) -> bool:
+        """
+        Fill several input fields in a single browser round trip.
+        
+        Values are set directly and input/change events are dispatched. Any selector
+        that matches nothing or isn't plain CSS falls back to safe_fill.
+        
+        Args:
+            fields: Mapping of element selector to value
+            
+        Returns:
+            True if every field was filled, False otherwise
+        """
+        logger.info(f"Filling {len(fields)} fields")
+        try:
+            missing = self.page.evaluate(_FILL_MANY_SCRIPT, fields)
+        except Exception as e:
+            logger.warning(f"Batch fill failed, filling fields one by one: {str(e)}")
+            missing = list(fields)
+        return all([self.safe_fill(selector, fields[selector]) for selector in missing])
+    
     def wait_for_element(self, selector: str, state: str = "visible", timeout: int = None) -> Optional[Locator]:
         """
         Wait for element to reach specified state.
@@ -225,7 +487,7 @@ class PageHelpers:
         timeout = timeout or self.default_timeout
         try:
             logger.debug(f"Waiting for element {selector} to be {state}")
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.wait_for(state=state, timeout=timeout)
             return element
         except Exception as e:
@@ -251,23 +513,27 @@ class PageHelpers:
                 logger.error(f"Failed to get text content from {selector}: {str(e)}")
         return None
     
-    def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
+    def is_element_visible(self, selector: str, wait_ms: int = 0) -> bool:
         """
         Check if element is visible on page.
         
+        By default this checks the current state without waiting; pass wait_ms to
+        give the element time to appear.
+        
         Args:
             selector: Element selector
-            timeout: Wait timeout in milliseconds
+            wait_ms: Time to wait for visibility in milliseconds (0 = check now)
             
         Returns:
             True if visible, False otherwise
         """
-        try:
-            element = self.page.locator(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            return True
-        except:
-            return False
+        element = self._loc(selector)
+        if wait_ms:
+            try:
+                element.first.wait_for(state="visible", timeout=wait_ms)
+            except Exception:
+                return False
+        return element.first.is_visible()
     
     def scroll_to_element(self, selector: str) -> bool:
         """
@@ -280,7 +546,7 @@ class PageHelpers:
             True if successful, False otherwise
         """
         try:
-            element = self.page.locator(selector)
+            element = self._loc(selector)
             element.scroll_into_view_if_needed()
             logger.debug(f"Scrolled to element: {selector}")
             return True
@@ -369,11 +635,34 @@ class WaitHelpers:
             logger.warning(f"Page did not reach networkidle state: {str(e)}")
             return False
     
+    def wait_for_js(self, js_expr: str, timeout: int = 30000) -> bool:
+        """
+        Wait for a JavaScript expression to become truthy.
+        
+        The expression is polled inside the browser, so no round trip is made per poll.
+        
+        Args:
+            js_expr: JavaScript expression or function body evaluated in the page
+            timeout: Wait timeout in milliseconds
+            
+        Returns:
+            True if condition met, False if timeout
+        """
+        try:
+            self.page.wait_for_function(js_expr, timeout=timeout)
+            logger.debug(f"JS condition met: {js_expr}")
+            return True
+        except Exception as e:
+            logger.warning(f"JS condition not met within {timeout}ms: {str(e)}")
+            return False
+    
     def wait_for_condition(self, condition_func: Callable[[], bool], 
-                          timeout: int = 30000, poll_interval: float = 0.5) -> bool:
+                          timeout: int = 30000, poll_interval: float = 0.05) -> bool:
         """
         Wait for custom condition to be met.
         
+        Prefer wait_for_js for conditions on page state; this polls from Python.
+        
         Args:
             condition_func: Function that returns True when condition is met
             timeout: Wait timeout in milliseconds
@@ -399,6 +688,11 @@ class WaitHelpers:
         return False
 
 
+# Suffix for auto-generated screenshot names, shared by every helper instance so captures
+# within the same second never collide in the screenshots directory
+_screenshot_counter = itertools.count()
+
+
 class ScreenshotHelper:
     """
     Enhanced screenshot capabilities for test documentation and debugging.
@@ -421,8 +715,7 @@ class ScreenshotHelper:
             Path to saved screenshot
         """
         if not name:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name = f"screenshot_{timestamp}"
+            name = f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}_{next(_screenshot_counter)}"
         
         # Ensure proper file extension
         if not name.endswith('.png'):
@@ -450,8 +743,7 @@ class ScreenshotHelper:
             Path to saved screenshot
         """
         if not name:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name = f"element_{timestamp}.png"
+            name = f"element_{time.strftime('%Y%m%d_%H%M%S')}_{next(_screenshot_counter)}.png"
         
         screenshot_path = self.screenshots_dir / name
         
@@ -465,6 +757,60 @@ class ScreenshotHelper:
             return None
 
 
+class AsyncScreenshotHelper:
+    """
+    Screenshot capabilities for async Playwright pages.
+    Captures several elements concurrently instead of one after another.
+    """
+    
+    def __init__(self, page: AsyncPage):
+        self.page = page
+        self.screenshots_dir = Path("screenshots")
+        self.screenshots_dir.mkdir(exist_ok=True)
+    
+    async def take_element_screenshots(self, selectors: List[str]) -> List[Optional[Path]]:
+        """
+        Take screenshots of several elements concurrently.
+        
+        Args:
+            selectors: Element selectors to capture
+            
+        Returns:
+            Paths to saved screenshots, with None for any that failed
+        """
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        paths = [self.screenshots_dir / f"element_{timestamp}_{next(_screenshot_counter)}.png" for _ in selectors]
+        results = await asyncio.gather(
+            *[self.page.locator(selector).screenshot(path=path) for selector, path in zip(selectors, paths)],
+            return_exceptions=True
+        )
+        
+        saved = []
+        for selector, path, result in zip(selectors, paths, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to take element screenshot of {selector}: {str(result)}")
+                saved.append(None)
+            else:
+                logger.info(f"Element screenshot saved: {path}")
+                saved.append(path)
+        return saved
+
+
+# Marks the end of a monitored operation, measures it and returns navigation timing
+_PERFORMANCE_END_SCRIPT = """
+    () => {
+        performance.mark('operation-end');
+        performance.measure('operation-duration', 'operation-start', 'operation-end');
+        const timing = performance.getEntriesByType('navigation')[0];
+        return timing ? {
+            domContentLoaded: timing.domContentLoadedEventEnd - timing.domContentLoadedEventStart,
+            loadComplete: timing.loadEventEnd - timing.loadEventStart,
+            pageLoad: timing.loadEventEnd - timing.navigationStart
+        } : null;
+    }
+"""
+
+
 @contextmanager
 def performance_monitor(page: Page, operation_name: str):
     """
@@ -483,25 +829,12 @@ def performance_monitor(page: Page, operation_name: str):
     try:
         yield
     finally:
-        # End performance monitoring
-        page.evaluate("performance.mark('operation-end')")
-        page.evaluate("performance.measure('operation-duration', 'operation-start', 'operation-end')")
-        
         end_time = time.time()
         duration = (end_time - start_time) * 1000  # Convert to milliseconds
         
-        # Get navigation timing if available
+        # End performance monitoring and get navigation timing in a single round trip
         try:
-            navigation_timing = page.evaluate("""
-                () => {
-                    const timing = performance.getEntriesByType('navigation')[0];
-                    return timing ? {
-                        domContentLoaded: timing.domContentLoadedEventEnd - timing.domContentLoadedEventStart,
-                        loadComplete: timing.loadEventEnd - timing.loadEventStart,
-                        pageLoad: timing.loadEventEnd - timing.navigationStart
-                    } : null;
-                }
-            """)
+            navigation_timing = page.evaluate(_PERFORMANCE_END_SCRIPT)
             
             if navigation_timing:
                 logger.info(f"Performance metrics for {operation_name}:")
@@ -555,26 +888,44 @@ class DatabaseHelper:
 
 
 def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, 
-                    exceptions: tuple = (Exception,)):
+                    exceptions: tuple = (Exception,), backoff_cap: float = 30.0,
+                    max_total_time: float = None,
+                    giveup: Callable[[Exception], bool] = None):
     """
     Decorator for retrying operations that may fail transiently.
     
+    Waits grow exponentially (delay, 2*delay, 4*delay, ... up to backoff_cap) with
+    random jitter so parallel workers don't retry in lockstep.
+    
     Args:
         max_attempts: Maximum number of retry attempts
-        delay: Delay between attempts in seconds
+        delay: Base delay between attempts in seconds
         exceptions: Tuple of exceptions to catch and retry
+        backoff_cap: Upper bound on the exponential part of the delay in seconds
+        max_total_time: Stop retrying once this many seconds have elapsed
+        giveup: Predicate returning True for errors that should not be retried
+            (e.g. 4xx client errors)
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            deadline = time.monotonic() + max_total_time if max_total_time is not None else None
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
+                    if giveup is not None and giveup(e):
+                        logger.error(f"Function {func.__name__} failed with non-retryable error: {str(e)}")
+                        raise
                     if attempt == max_attempts - 1:
                         logger.error(f"Function {func.__name__} failed after {max_attempts} attempts: {str(e)}")
                         raise
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {delay}s...")
-                    time.sleep(delay)
+                    sleep_for = min(backoff_cap, delay * (2 ** attempt)) + random.uniform(0, delay / 2)
+                    if deadline is not None and time.monotonic() + sleep_for > deadline:
+                        logger.error(f"Function {func.__name__} exceeded {max_total_time}s retry budget: {str(e)}")
+                        raise
+                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {sleep_for:.2f}s...")
+                    time.sleep(sleep_for)
             return None
         return wrapper
     return decorator
@@ -0,0 +1,22 @@
+"""
+Logging utilities for Parabank automation framework.
+Provides named loggers for page objects and helpers.
+"""
+
+import logging
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a named logger; handlers and levels are left to pytest/the caller."""
+    return logging.getLogger(name)
+
+
+class Logger:
+    """
+    Logger access for page objects.
+    """
+    
+    @staticmethod
+    def get_logger(name: str) -> logging.Logger:
+        """Get a named logger."""
+        return get_logger(name)
@@ -0,0 +1,20 @@
+import asyncio
+from src.api.async_base_api import AsyncBaseAPI
+
+# Tests for AsyncBaseAPI session handling. These do not make any HTTP calls.
+
+
+async def _open_session():
+    async with AsyncBaseAPI() as api:
+        session = api._get_session()
+        assert session is api._get_session()
+        assert not session.closed
+        return session
+
+
+# Test that each event loop gets its own open session and that it is closed on exit.
+def test_session_is_per_event_loop():
+    first = asyncio.run(_open_session())
+    second = asyncio.run(_open_session())
+    assert first.closed and second.closed
+    assert first is not second
@@ -0,0 +1,62 @@
+import io
+import pytest
+import requests
+from src.api.base_api import BaseAPI
+
+# Unit tests for BaseAPI.download. No HTTP calls are made: the shared session is replaced with
+# one that returns a prepared requests.Response.
+
+
+class _BrokenStream(io.BytesIO):
+    # Yields one chunk, then fails as if the connection dropped mid-body.
+    def read(self, *args, **kwargs):
+        if self.tell():
+            raise requests.ConnectionError("connection reset")
+        return super().read(4)
+
+
+class _Session:
+    def __init__(self, status_code, raw):
+        self.status_code = status_code
+        self.raw = raw
+        self.kwargs = None
+
+    def request(self, method, url, **kwargs):
+        self.kwargs = kwargs
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = "Not Found" if self.status_code == 404 else "OK"
+        response.url = url
+        response.raw = self.raw
+        return response
+
+
+def _api(status_code=200, raw=None):
+    api = BaseAPI("http://parabank.test/bank")
+    api.session = _Session(status_code, raw or io.BytesIO(b"statement body"))
+    return api
+
+
+# Test that the body is streamed to dest_path through the shared dispatcher.
+def test_download_streams_to_file(tmp_path):
+    api = _api()
+    dest = api.download("customers/1/statement", tmp_path / "statement.txt")
+    assert dest.read_bytes() == b"statement body"
+    assert api.session.kwargs["stream"] is True
+    assert api.session.kwargs["timeout"] == 10
+
+
+# Test that a failed status raises the same HTTPError as the other verbs and writes nothing.
+def test_download_error_matches_other_verbs(tmp_path):
+    dest = tmp_path / "statement.txt"
+    with pytest.raises(requests.HTTPError, match="404 Error: Not Found for url: http://parabank.test/bank/customers/1"):
+        _api(status_code=404).download("customers/1", dest)
+    assert not dest.exists()
+
+
+# Test that a download failing part-way removes the partial file.
+def test_download_removes_partial_file(tmp_path):
+    dest = tmp_path / "statement.txt"
+    with pytest.raises(requests.ConnectionError):
+        _api(raw=_BrokenStream(b"statement body")).download("customers/1/statement", dest)
+    assert not dest.exists()
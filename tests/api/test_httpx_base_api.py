@@ -0,0 +1,31 @@
+import httpx
+import pytest
+import requests
+from src.api.httpx_base_api import HttpxBaseAPI
+
+# Unit tests for the httpx backend. Responses come from an in-process mock transport.
+
+
+@pytest.fixture
+def api():
+    api = HttpxBaseAPI("http://parabank.test/bank")
+    api.client = httpx.Client(
+        base_url=api.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(404, text="not found")),
+    )
+    yield api
+    api.client.close()
+
+
+# Test that HTTP errors surface as requests.HTTPError, matching BaseAPI.
+def test_request_errors_match_requests_backend(api):
+    with pytest.raises(requests.HTTPError) as excinfo:
+        api.get("customers/1")
+    assert excinfo.value.response.status_code == 404
+    assert "404 Error: Not Found for url: http://parabank.test/bank/customers/1" in str(excinfo.value)
+
+
+# Test that failed downloads raise the same error type.
+def test_download_errors_match_requests_backend(api, tmp_path):
+    with pytest.raises(requests.HTTPError):
+        api.download("customers/1/statement", tmp_path / "statement.pdf")
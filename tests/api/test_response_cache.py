@@ -0,0 +1,96 @@
+import pytest
+from src.api import base_api
+from src.api._cache import TTLCache
+from src.api.base_api import BaseAPI
+
+# Unit tests for the BaseAPI response cache. No HTTP calls are made: the shared session is
+# replaced with a recorder that returns canned responses.
+
+
+class _Response:
+    status_code = 200
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return _Response()
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(base_api, "_RESPONSE_CACHE", TTLCache())
+    api = BaseAPI("http://parabank.test/bank")
+    api.session = _RecordingSession()
+    return api
+
+
+# Test that entries expire once their TTL has passed.
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.api._cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=30)
+    cache.set(("http://a/x", ()), "value")
+    assert cache.get(("http://a/x", ())) == "value"
+    now[0] += 31
+    assert cache.get(("http://a/x", ())) is None
+
+
+# Test that the oldest entry is dropped once maxsize is reached.
+def test_ttl_cache_evicts_oldest_when_full():
+    cache = TTLCache(maxsize=2)
+    cache.set(("http://a/1", ()), 1)
+    cache.set(("http://a/2", ()), 2)
+    cache.set(("http://a/3", ()), 3)
+    assert cache.get(("http://a/1", ())) is None
+    assert cache.get(("http://a/3", ())) == 3
+
+
+# Test that evict_prefix only drops entries under the given URL prefix.
+def test_ttl_cache_evict_prefix():
+    cache = TTLCache()
+    cache.set(("http://a/customers/1", ()), 1)
+    cache.set(("http://a/accounts/1", ()), 2)
+    cache.evict_prefix("http://a/customers")
+    assert cache.get(("http://a/customers/1", ())) is None
+    assert cache.get(("http://a/accounts/1", ())) == 2
+
+
+# Test that a repeated cached GET is served without a second request.
+def test_cached_get_reuses_response(api):
+    first = api.get("customers/1", cache=True)
+    assert api.get("customers/1", cache=True) is first
+    assert len(api.session.calls) == 1
+
+
+# Test that params given as a list of tuples or bytes are accepted, as requests allows.
+@pytest.mark.parametrize("params", [[("a", "1"), ("a", "2")], b"a=1&a=2", {"a": ["1", "2"]}])
+def test_cached_get_accepts_requests_param_forms(api, params):
+    api.get("customers/1", params=params, cache=True)
+    api.get("customers/1", params=params, cache=True)
+    assert len(api.session.calls) == 1
+
+
+# Test that different headers (e.g. credentials) don't share a cache entry.
+def test_cached_get_keys_on_headers(api):
+    api.get("customers/1", headers={"Authorization": "a"}, cache=True)
+    api.get("customers/1", headers={"Authorization": "b"}, cache=True)
+    assert len(api.session.calls) == 2
+
+
+# Test that requests with options such as auth are never cached.
+def test_cached_get_skips_requests_with_auth(api):
+    api.get("customers/1", auth=("john", "demo"), cache=True)
+    api.get("customers/1", auth=("john", "demo"), cache=True)
+    assert len(api.session.calls) == 2
+
+
+# Test that a write evicts cached reads under the same top-level resource.
+def test_post_invalidates_cached_reads(api):
+    api.get("customers/1", cache=True)
+    api.post("customers/1/accounts")
+    api.get("customers/1", cache=True)
+    assert [call[0] for call in api.session.calls] == ["GET", "POST", "GET"]
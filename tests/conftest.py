@@ -0,0 +1,38 @@
+import pytest
+from src.api.clients import make_api
+from src.core.baseTest import BaseTest
+
+# Shared fixtures for the Parabank test suite.
+
+
+# Logs in once per session and saves the resulting cookies/localStorage so tests can open
+# pre-authenticated contexts instead of repeating the login flow.
+@pytest.fixture(scope="session")
+def auth_state(browser, tmp_path_factory):
+    context = browser.new_context()
+    page = context.new_page()
+    test = BaseTest(page)
+    test.login("john", "demo")
+    # Fail here rather than saving a rejected login as the authenticated state
+    test.validate_login_success()
+    path = tmp_path_factory.mktemp("auth") / "auth.json"
+    context.storage_state(path=path)
+    context.close()
+    return path
+
+
+# A page in a fresh context that is already logged in as the default test user.
+@pytest.fixture
+def authenticated_page(browser, auth_state):
+    context = browser.new_context(storage_state=auth_state)
+    page = context.new_page()
+    yield page
+    context.close()
+
+
+# One API client for the whole session. The clients already pool their connections per
+# base_url, so every test reuses the same keep-alive connections. USE_HTTPX=1 switches to
+# the httpx/HTTP2 client.
+@pytest.fixture(scope="session")
+def api():
+    return make_api()
@@ -1,13 +1,14 @@
-
+import pytest
 from framework.base_test import BaseTest
 from pages.LoginPage import LoginPage
 
 # Test for valid login functionality in the Parabank application.
 
-def test_valid_login(page):
+@pytest.mark.parametrize("username,password", [("john", "demo")])
+def test_valid_login(page, username, password):
     login_page = LoginPage(page)
     login_page.navigate()
-    login_page.login("john", "demo")
+    login_page.login(username, password)
 
     test = BaseTest(page)
     test.validate_login_success()
\ No newline at end of file
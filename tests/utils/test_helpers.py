@@ -0,0 +1,216 @@
+import json
+import os
+import time
+import pytest
+from src.utils.helpers import ConfigManager, DataGenerator, retry_on_failure
+
+# Unit tests for the helper utilities. These run without a browser or network.
+
+
+def _write_config(path, text, mtime=None):
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+# Test that ConfigManager reads nested values with dot notation.
+def test_config_get_dotted_key(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "environments:\n  dev:\n    url: http://dev\n")
+    config = ConfigManager(str(config_file))
+    assert config.get("environments.dev.url") == "http://dev"
+    assert config.get("environments.qa.url", "missing") == "missing"
+
+
+# Test that the parsed file is reused until its mtime changes.
+def test_config_reloads_when_mtime_changes(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "a:\n  b: 1\n", mtime=time.time() + 10)
+    assert ConfigManager(str(config_file)).get("a.b") == 1
+
+    _write_config(config_file, "a:\n  b: 2\n", mtime=time.time() + 20)
+    assert ConfigManager(str(config_file)).get("a.b") == 2
+
+
+# Test that edits to one instance's nested config don't leak into other instances.
+def test_config_instances_do_not_share_nested_data(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "a:\n  b: 1\n")
+    first = ConfigManager(str(config_file))
+    first.config["a"]["b"] = 99
+    assert ConfigManager(str(config_file)).get("a.b") == 1
+
+
+# Test that refresh_env applies new environment overrides to an already-loaded instance.
+def test_config_refresh_env_updates_loaded_instances(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "browser: firefox\n")
+    config = ConfigManager(str(config_file))
+    try:
+        monkeypatch.delenv("TEST_ENV", raising=False)
+        ConfigManager.refresh_env()
+        assert config.get("environment") == "dev"
+        monkeypatch.setenv("TEST_ENV", "staging")
+        ConfigManager.refresh_env()
+        assert config.get("environment") == "staging"
+    finally:
+        monkeypatch.undo()
+        ConfigManager.refresh_env()
+
+
+# Test that a second load is served from the JSON sidecar written by the first.
+def test_config_sidecar_is_written_and_reused(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "a:\n  b: 1\n")
+    ConfigManager(str(config_file)).get("a.b")
+    assert (tmp_path / "config.yaml.cache.json").exists()
+
+    monkeypatch.setattr(ConfigManager, "_cache", {})
+    monkeypatch.setattr("src.utils.helpers.yaml.load", lambda *args, **kwargs: pytest.fail("YAML was re-parsed"))
+    assert ConfigManager(str(config_file)).get("a.b") == 1
+
+
+# Test that an empty (e.g. half-written) sidecar falls back to parsing the YAML.
+def test_config_ignores_corrupt_sidecar(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "a:\n  b: 1\n")
+    (tmp_path / "config.yaml.cache.json").write_bytes(b"")
+    monkeypatch.setattr(ConfigManager, "_cache", {})
+    assert ConfigManager(str(config_file)).get("a.b") == 1
+
+
+# Test that YAML with non-string keys is not cached as JSON, so reloads return the same data.
+# Covers both the orjson encoder and the stdlib json fallback.
+@pytest.mark.parametrize("use_stdlib_json", [False, True])
+def test_config_skips_sidecar_for_non_string_keys(tmp_path, monkeypatch, use_stdlib_json):
+    if use_stdlib_json:
+        monkeypatch.setattr("src.utils.helpers._json_dumps", lambda obj: json.dumps(obj).encode())
+        monkeypatch.setattr("src.utils.helpers._json_loads", json.loads)
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "codes:\n  404: not found\n")
+    assert ConfigManager(str(config_file)).get("codes") == {404: "not found"}
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+    monkeypatch.setattr(ConfigManager, "_cache", {})
+    assert ConfigManager(str(config_file)).get("codes") == {404: "not found"}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Fake clock: each recorded sleep advances time.monotonic by the same amount
+    recorded = []
+    monkeypatch.setattr("src.utils.helpers.time.sleep", recorded.append)
+    monkeypatch.setattr("src.utils.helpers.time.monotonic", lambda: sum(recorded))
+    monkeypatch.setattr("src.utils.helpers.random.uniform", lambda a, b: 0)
+    return recorded
+
+
+def _flaky(failures, exc=ValueError):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc("boom")
+        return "ok"
+
+    return func, calls
+
+
+# Test that retry waits double each attempt and are capped at backoff_cap.
+def test_retry_backoff_is_exponential_and_capped(sleeps):
+    func, calls = _flaky(4)
+    assert retry_on_failure(max_attempts=5, delay=1.0, backoff_cap=3.0)(func)() == "ok"
+    assert len(calls) == 5
+    assert sleeps == [1.0, 2.0, 3.0, 3.0]
+
+
+# Test that the last error is re-raised once max_attempts is used up.
+def test_retry_raises_after_max_attempts(sleeps):
+    func, calls = _flaky(5)
+    with pytest.raises(ValueError):
+        retry_on_failure(max_attempts=3, delay=0.5)(func)()
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+# Test that errors matching giveup, or not listed in exceptions, are not retried.
+@pytest.mark.parametrize("kwargs", [
+    {"giveup": lambda e: True},
+    {"exceptions": (KeyError,)},
+])
+def test_retry_does_not_retry_excluded_errors(sleeps, kwargs):
+    func, calls = _flaky(1)
+    with pytest.raises(ValueError):
+        retry_on_failure(**kwargs)(func)()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+# Test that retrying stops once the next wait would exceed max_total_time.
+def test_retry_respects_max_total_time(sleeps):
+    func, calls = _flaky(5)
+    with pytest.raises(ValueError):
+        retry_on_failure(max_attempts=5, delay=1.0, max_total_time=2.5)(func)()
+    assert sleeps == [1.0]
+    assert len(calls) == 2
+
+
+# Test that the decorator keeps the wrapped function's name and docstring.
+def test_retry_preserves_function_metadata():
+    @retry_on_failure()
+    def fetch_account():
+        """Fetch an account."""
+
+    assert fetch_account.__name__ == "fetch_account"
+    assert fetch_account.__doc__ == "Fetch an account."
+
+
+# Test that the same seed always produces the same batch of users.
+def test_create_test_users_is_deterministic_for_a_seed():
+    first = DataGenerator.create_test_users(5, seed=42)
+    assert first == DataGenerator.create_test_users(5, seed=42)
+    assert first != DataGenerator.create_test_users(5, seed=43)
+    assert all(user.username.startswith("testuser_") for user in first)
+
+
+# Test that generated phone numbers stay in the documented US format and ranges.
+def test_create_test_users_phone_format():
+    for user in DataGenerator.create_test_users(50, seed=1):
+        area_code, rest = user.phone[1:].split(") ")
+        exchange, number = rest.split("-")
+        assert 200 <= int(area_code) <= 999
+        assert 200 <= int(exchange) <= 999
+        assert 1000 <= int(number) <= 9999
+
+
+# Test that a fixture file is reused for the same arguments and regenerated when they change.
+def test_create_test_users_fixture_cache(tmp_path, monkeypatch):
+    fixture = tmp_path / "users.json"
+    users = DataGenerator.create_test_users(3, seed=7, fixture_path=fixture)
+    assert fixture.exists()
+
+    def fail(*args):
+        raise AssertionError("fixture should have been reused")
+
+    monkeypatch.setattr("src.utils.helpers._generate_test_users", fail)
+    assert DataGenerator.create_test_users(3, seed=7, fixture_path=fixture) == users
+    with pytest.raises(AssertionError):
+        DataGenerator.create_test_users(4, seed=7, fixture_path=fixture)
+
+
+# Test that a truncated or malformed fixture file is regenerated instead of crashing.
+@pytest.mark.parametrize("content", [b'{"signature": "abc", "us', b"[]", b'{"signature": 1}'])
+def test_create_test_users_corrupt_fixture(tmp_path, content):
+    fixture = tmp_path / "users.json"
+    fixture.write_bytes(content)
+    users = DataGenerator.create_test_users(3, seed=7, fixture_path=fixture)
+    assert users == DataGenerator.create_test_users(3, seed=7)
+    assert json.loads(fixture.read_bytes())["users"][0]["username"] == users[0].username
+
+
+# Test that sharding across worker processes returns n users and is reproducible for a seed.
+def test_create_test_users_with_workers():
+    users = DataGenerator.create_test_users(7, seed=3, workers=2)
+    assert len(users) == 7
+    assert users == DataGenerator.create_test_users(7, seed=3, workers=2)